@@ -5,11 +5,15 @@ WWAQ Quick Checker
 Prüft Text auf häufige WWAQ-Verstöße
 
 Verwendung: python3 check_wwaq.py "Dein Text hier"
+Maschinenlesbar: python3 check_wwaq.py --jsonl|--sarif datei1.md datei2.txt ...
 """
 
 import sys
 import re
 
+from wwaq_system.validators.fuzzy_index import SEFIROT, FuzzyTermIndex
+from wwaq_system.validators.result_stream import JsonLinesWriter, SarifWriter, stream_validate
+
 class WWAQQuickChecker:
     def __init__(self):
         # Falsche Schreibweisen
@@ -67,10 +71,19 @@ class WWAQQuickChecker:
             'magie',
             'gemeinsam auf dem weg'
         ]
+        
+        # Fuzzy-Index für Beinahe-Treffer
+        self.fuzzy_index = FuzzyTermIndex()
+        self.fuzzy_index.add_mapping({
+            falsch.replace(r'\b', ''): richtig
+            for falsch, richtig in self.falsche_schreibweisen.items()
+        })
+        self.fuzzy_index.add_terms(SEFIROT)
     
     def check(self, text):
         """Prüft Text und gibt Fehler aus"""
         fehler = []
+        hinweise = []
         
         # Prüfe falsche Schreibweisen
         for falsch, richtig in self.falsche_schreibweisen.items():
@@ -93,7 +106,17 @@ class WWAQQuickChecker:
         if not text.strip().endswith("Q!"):
             fehler.append("❌ Text sollte mit 'Q!' enden")
         
+        # Prüfe Beinahe-Treffer (nur Hinweise)
+        for match in self.fuzzy_index.scan(re.findall(r'\w+', text)):
+            hinweise.append(f"💡 '{match.token}' → meinte vermutlich '{match.canonical}'?")
+        
         # Ausgabe
+        if hinweise:
+            print("HINWEISE:")
+            for h in hinweise:
+                print(h)
+            print()
+        
         if fehler:
             print("WWAQ-VERSTÖSSE GEFUNDEN:")
             print("-" * 40)
@@ -106,12 +129,36 @@ class WWAQQuickChecker:
             print("✓ Text ist WWAQ-konform!")
             return True
 
+def _read_files(paths, missing):
+    """Liest Dateien einzeln ein, sobald sie gebraucht werden"""
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            print(f"Datei nicht gefunden: {path}", file=sys.stderr)
+            missing.append(path)
+            continue
+        yield path, text
+
+def stream_main(fmt, paths):
+    """Schreibt Ergebnisse als JSON Lines oder SARIF nach stdout"""
+    missing = []
+    writer = SarifWriter(sys.stdout) if fmt == '--sarif' else JsonLinesWriter(sys.stdout)
+    with writer:
+        summary = stream_validate(_read_files(paths, missing), writer)
+    sys.exit(1 if summary['errors'] or missing else 0)
+
 def main():
     if len(sys.argv) < 2:
         print("Verwendung: python3 check_wwaq.py \"Dein Text hier\"")
         print("Oder: python3 check_wwaq.py datei.txt")
+        print("Oder: python3 check_wwaq.py --jsonl|--sarif datei1.md datei2.txt ...")
         sys.exit(1)
     
+    if sys.argv[1] in ('--jsonl', '--sarif'):
+        stream_main(sys.argv[1], sys.argv[2:])
+    
     checker = WWAQQuickChecker()
     
     # Prüfe ob Argument eine Datei ist
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Context Rules
+Testet den Intervall-Index für Kontext-Ausnahmen
+
+Stand: 29. Siwan 5785
+"""
+
+import sys
+from pathlib import Path
+
+# Füge Projekt-Root zum Python-Path hinzu
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from wwaq_system.validators.context_rules import AnchorIndex, ContextException
+from wwaq_system.validators.equivalence import compare
+from wwaq_system.validators.reference_validator import ReferenceWWAQValidator
+from wwaq_system.validators.wwaq_validator import WWAQValidator
+
+
+def _window_reference(text, start, end, anchors, window):
+    """Bisherige Logik: Kontext-Ausschnitt pro Treffer"""
+    context = text[max(0, start - window):end + window]
+    return any(anchor in context for anchor in anchors)
+
+
+def test_anchor_index_matches_window_slicing():
+    """Test ob der Index dieselben Ausnahmen liefert wie der Ausschnitt"""
+    exception = ContextException(anchors=('Berg', 'Centre'), window=50)
+    text = ("Kabbala " * 5 + "Berg " + "x" * 60 + " Kabbala " +
+            "y" * 45 + " Centre " + "Kabbala " * 3)
+    index = AnchorIndex(text, [exception])
+
+    for start in range(len(text)):
+        for end in (start, start + 7):
+            expected = _window_reference(text, start, end, exception.anchors, 50)
+            assert exception.is_excepted(index, start, end) == expected, \
+                f"Abweichung bei ({start}, {end})"
+
+    print("✓ Intervall-Index entspricht Kontext-Ausschnitt")
+
+
+def test_anchor_boundaries():
+    """Test Fenstergrenzen: Anker muss vollständig im Fenster liegen"""
+    exception = ContextException(anchors=('Berg',), window=5)
+    text = "Berg.....Kabbala"
+    index = AnchorIndex(text, [exception])
+
+    # Treffer 'Kabbala' beginnt bei 9: Fenster ab 4, 'Berg' beginnt bei 0
+    assert not exception.is_excepted(index, 9, 16)
+    # Fenster ab 0 enthält 'Berg' vollständig
+    assert exception.is_excepted(index, 5, 12)
+
+    print("✓ Fenstergrenzen korrekt")
+
+
+def test_case_insensitive_anchor():
+    """Test Anker ohne Beachtung der Groß-/Kleinschreibung"""
+    exception = ContextException(anchors=('Centre',), case_sensitive=False)
+    index = AnchorIndex("das CENTRE und die Kabbala", [exception])
+
+    assert exception.is_excepted(index, 19, 26)
+    assert not ContextException(anchors=('Centre',)).is_excepted(index, 19, 26)
+
+    # 'İ'.lower() hat zwei Zeichen: Positionen müssen im Original stimmen
+    exception = ContextException(anchors=('centre',), window=5, case_sensitive=False)
+    text = '\u0130' * 23 + ' centre' + '.' * 20 + 'Kabbala'
+    index = AnchorIndex(text, [exception])
+    assert not exception.is_excepted(index, 50, 57)
+    assert exception.is_excepted(index, 29, 36)
+
+    print("✓ Anker ohne Groß-/Kleinschreibung")
+
+
+def test_declarative_exception_in_validator():
+    """Test ob Regeln Ausnahmen deklarativ erhalten"""
+    validator = WWAQValidator()
+    validator.context_exceptions['q-vs-k'] = ContextException(anchors=('Zitat',))
+
+    result = validator.validate("Zitat: Die Kabbala lehrt uns")
+    assert not [e for e in result.errors if 'K statt Q' in e]
+
+    result = validator.validate("Berg Kabbalah Centre")
+    assert [e for e in result.errors if 'K statt Q' in e]
+
+    print("✓ Deklarative Kontext-Ausnahmen funktionieren")
+
+
+def test_exceptions_apply_to_every_rule():
+    """Test dass jede Regel mit Position Ausnahmen aus der Tabelle beachtet"""
+    text = "Zitat: Tikkun, zerbrach, liebevoll ✨ Kabalah"
+    validator = WWAQValidator()
+    before = {v.rule for v in validator.validate(text).violations}
+    assert {'din-31636', 'zer-praefix', 'anthropomorphismus',
+            'emoji', 'beinahe-treffer'} <= before
+
+    for rule in before - {'q-ende'}:
+        validator.context_exceptions[rule] = ContextException(anchors=('Zitat',))
+    result = validator.validate(text)
+
+    assert [v.rule for v in result.violations] == ['q-ende']
+    assert result.transformations == []
+
+    # Die Referenz liest dieselbe Tabelle
+    reference = ReferenceWWAQValidator()
+    reference.context_exceptions = validator.context_exceptions
+    validator.suggestions = False
+    diffs, _ = compare(text, reference, validator)
+    assert diffs == [], diffs
+
+    print("✓ Ausnahmen gelten für alle Regeln")
+
+
+if __name__ == "__main__":
+    print("\nCONTEXT RULES TESTS")
+    print("="*40)
+
+    try:
+        test_anchor_index_matches_window_slicing()
+        test_anchor_boundaries()
+        test_case_insensitive_anchor()
+        test_declarative_exception_in_validator()
+        test_exceptions_apply_to_every_rule()
+
+        print("\n✓ Alle Kontext-Tests bestanden!")
+        print("\nQ!")
+    except AssertionError as e:
+        print(f"\n✗ Test fehlgeschlagen: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Fehler: {e}")
+        sys.exit(1)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Equivalence
+Vergleicht WWAQValidator mit der eingefrorenen Referenz-Implementierung
+
+Stand: 29. Siwan 5785
+"""
+
+import sys
+import unicodedata
+from pathlib import Path
+
+# Füge Projekt-Root zum Python-Path hinzu
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from wwaq_system.validators.equivalence import (
+    compare, corpus_texts, generate_texts, run_equivalence
+)
+from wwaq_system.validators.reference_validator import ReferenceWWAQValidator
+from wwaq_system.validators.wwaq_validator import WWAQValidator
+
+
+def test_generated_inputs_equivalent():
+    """Test generierte Eingaben: Validator entspricht Referenz"""
+    report = run_equivalence(generate_texts(300))
+
+    assert report.cases == 300
+    assert report.equivalent, "\n".join(report.mismatches[:5])
+    assert report.speed_ratio > 0
+
+    print(f"✓ {report.cases} generierte Fälle äquivalent ({report.speed_ratio:.2f}x)")
+
+
+def test_corpus_inputs_equivalent():
+    """Test Korpus-Dateien des Projekts"""
+    paths = sorted(project_root.glob('*.md')) + sorted(project_root.glob('*.txt'))
+    report = run_equivalence(corpus_texts(paths))
+
+    assert report.equivalent, "\n".join(report.mismatches[:5])
+
+    print(f"✓ {report.cases} Korpus-Dateien äquivalent")
+
+
+def test_generator_is_deterministic():
+    """Test gleicher Seed liefert gleiche Texte"""
+    assert generate_texts(20, seed=1) == generate_texts(20, seed=1)
+    assert generate_texts(20, seed=1) != generate_texts(20, seed=2)
+
+    print("✓ Generator ist deterministisch")
+
+
+def test_generator_covers_unicode():
+    """Test generierte Eingaben enthalten zerlegte Umlaute und Niqqud"""
+    texts = generate_texts(300)
+
+    assert any(not unicodedata.is_normalized('NFC', t) for t in texts)
+    assert any('\u05b8' in t for t in texts)  # Qamaz
+
+    print("✓ Generator erzeugt NFD- und Niqqud-Eingaben")
+
+
+def test_normalization_is_visible():
+    """Test dass die Normalisierung als dokumentierte Abweichung geprüft wird"""
+    text = "Der Tempel wurde zersto\u0308rt."  # kombinierendes Trema
+
+    diffs, documented = compare(text, ReferenceWWAQValidator(), WWAQValidator())
+    assert diffs == []
+    assert any('Normalisierung' in d for d in documented)
+
+    # Ein Kandidat ohne Normalisierung fällt auf
+    diffs, _ = compare(text, ReferenceWWAQValidator(), ReferenceWWAQValidator())
+    assert any(d.startswith('errors') for d in diffs)
+
+    print("✓ Normalisierung im Vergleich sichtbar")
+
+
+def test_timing_compares_same_work():
+    """Test Vorschläge (nur im Kandidaten) zählen nicht zur Laufzeit"""
+    assert WWAQValidator(suggestions=False).validate("Die Kabalah lehrt").suggestions == []
+    assert WWAQValidator().validate("Die Kabalah lehrt").suggestions != []
+
+    report = run_equivalence(generate_texts(50))
+    assert report.reference_seconds > 0 and report.candidate_seconds > 0
+
+    print("✓ Laufzeitvergleich misst gleiche Arbeit")
+
+
+def test_divergence_detected():
+    """Test dass Abweichungen einer Engine gemeldet werden"""
+
+    class BrokenValidator(WWAQValidator):
+        def _check_q_ending(self, text, result):
+            pass
+
+    diffs, _ = compare("Die Kabbala lehrt", ReferenceWWAQValidator(), BrokenValidator())
+
+    assert any(d.startswith('warnings') for d in diffs)
+    assert any(d.startswith('score') for d in diffs)
+
+    print("✓ Abweichungen werden erkannt")
+
+
+def test_broken_transform_on_ambiguous_input():
+    """Test dass mehrdeutige Eingaben die Transformation trotzdem prüfen"""
+
+    class BrokenTransform(WWAQValidator):
+        def transform(self, text):
+            return 'garbage'
+
+    # Doppeltes Vorkommen; einmal im Ausnahme-Fenster, einmal außerhalb
+    texts = ["Kabbala kabbala.", "Berg Centre: Kabbala." + " und" * 20 + " Kabbala.\n\nQ!"]
+
+    for text in texts:
+        diffs, _ = compare(text, ReferenceWWAQValidator(), BrokenTransform())
+        assert any(d.startswith('transform') for d in diffs), text
+
+    # Die korrekte Engine bleibt auf denselben Eingaben äquivalent
+    for text in texts:
+        diffs, _ = compare(text, ReferenceWWAQValidator(), WWAQValidator())
+        assert diffs == [], diffs
+
+    print("✓ Kaputte Transformation auf mehrdeutiger Eingabe erkannt")
+
+
+if __name__ == "__main__":
+    print("\nEQUIVALENCE TESTS")
+    print("="*40)
+
+    try:
+        test_generated_inputs_equivalent()
+        test_corpus_inputs_equivalent()
+        test_generator_is_deterministic()
+        test_generator_covers_unicode()
+        test_normalization_is_visible()
+        test_timing_compares_same_work()
+        test_divergence_detected()
+        test_broken_transform_on_ambiguous_input()
+
+        print("\n✓ Alle Äquivalenz-Tests bestanden!")
+        print("\nQ!")
+    except AssertionError as e:
+        print(f"\n✗ Test fehlgeschlagen: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Fehler: {e}")
+        sys.exit(1)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Fuzzy Index
+Testet die Erkennung von Beinahe-Treffern
+
+Stand: 29. Siwan 5785
+"""
+
+import sys
+from pathlib import Path
+
+# Füge Projekt-Root zum Python-Path hinzu
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from wwaq_system.validators.fuzzy_index import FuzzyTermIndex, _edit_distance, _is_soft_edit
+from wwaq_system.validators.wwaq_validator import WWAQValidator, validate_text
+from check_wwaq import WWAQQuickChecker
+
+
+def test_near_miss_detection():
+    """Test Erkennung ungenauer Transliterationen"""
+    validator = WWAQValidator()
+
+    test_cases = [
+        ("Die Kabalah lehrt", 'Qabbala'),
+        ("Der Tzimzoum", 'Zimzum'),
+        ("Tikoun olam", 'Tiqqun'),
+        ("Dwekuth erreichen", 'Dwekut'),
+        ("Die Sefira Malchuth", 'Malchut'),
+    ]
+
+    for text, expected in test_cases:
+        result = validator.validate(text)
+        assert any(expected in s for s in result.suggestions), \
+            f"Beinahe-Treffer nicht erkannt: {text}"
+
+    text = "Tikoun und Tikoun"
+    notes = [v for v in validator.validate(text).violations if v.rule == 'beinahe-treffer']
+    assert [(v.start, v.end) for v in notes] == [(0, 6), (11, 17)]
+
+    print("✓ Beinahe-Treffer werden erkannt")
+
+
+def test_exact_terms_not_suggested():
+    """Test dass exakte Varianten und korrekte Formen keine Vorschläge erzeugen"""
+    validator = WWAQValidator()
+
+    for text in ["Die Qabbala und Tiqqun", "Die Kabbala lehrt", "Chessed und Gewura"]:
+        result = validator.validate(text)
+        assert result.suggestions == [], f"Unerwarteter Vorschlag für: {text}"
+
+    print("✓ Keine Vorschläge für exakte Treffer")
+
+
+def test_common_german_words_not_suggested():
+    """Test dass gewöhnliche deutsche Wörter keine Vorschläge erzeugen"""
+    validator = WWAQValidator()
+    checker = WWAQQuickChecker()
+
+    words = [
+        'Meter', 'Peter', 'Ketzer', 'Kater', 'Kelter', 'Hafer', 'Haber',
+        'Haven', 'Taver', 'Binar', 'Gewurz', 'Keller', 'Leiter', 'Gewehr',
+        'Kabel', 'Kabine', 'Kuchen', 'Zimmer', 'Winter', 'Ketten', 'Gewinn'
+    ]
+    prose = ("Peter trank im Winter Hafer mit Meter langem Kabel, "
+             "der Kater saß im Keller neben der Kelter. ")
+
+    result = validator.validate(prose + ' '.join(words))
+    assert result.suggestions == [], f"Falsch-positive Vorschläge: {result.suggestions}"
+
+    for word in words:
+        assert checker.fuzzy_index.lookup(word) is None, f"Falsch-positiv im QuickChecker: {word}"
+
+    print("✓ Keine Vorschläge für gewöhnliche deutsche Wörter")
+
+
+def test_suggestions_do_not_affect_score():
+    """Test dass Vorschläge eine eigene Stufe sind"""
+    result = validate_text("Die Kabalah lehrt.\n\nQ!")
+
+    assert result['valid']
+    assert result['score'] == 100
+    assert len(result['suggestions']) == 1
+
+    print("✓ Vorschläge beeinflussen Score nicht")
+
+
+def test_index_lookup():
+    """Test Index-Lookup und Distanzfunktion"""
+    index = FuzzyTermIndex(max_distance=2)
+    index.add_mapping({'tikkun': 'Tiqqun'})
+
+    assert index.lookup('Tiqun').canonical == 'Tiqqun'
+    assert index.lookup('Tikkunim') is not None
+    assert index.lookup('Tiqqun') is None
+    assert index.lookup('Olam') is None
+
+    assert [m.token for m in index.scan(["Tiqun", "und", "Tiqun"])] == ["Tiqun", "Tiqun"]
+
+    assert _edit_distance('dwekut', 'dwekuth', 2) == 1
+    assert _edit_distance('keter', 'ketre', 2) == 1  # Vertauschung
+    assert _edit_distance('abcdef', 'uvwxyz', 2) == 3
+
+    assert _is_soft_edit('tikoun', 'tikun')
+    assert _is_soft_edit('jesod', 'jessod')
+    assert not _is_soft_edit('ketzer', 'keter')
+    assert not _is_soft_edit('hafer', 'haver')
+
+    print("✓ Index-Lookup funktioniert")
+
+
+if __name__ == "__main__":
+    print("\nFUZZY INDEX TESTS")
+    print("="*40)
+
+    try:
+        test_near_miss_detection()
+        test_exact_terms_not_suggested()
+        test_common_german_words_not_suggested()
+        test_suggestions_do_not_affect_score()
+        test_index_lookup()
+
+        print("\n✓ Alle Fuzzy-Tests bestanden!")
+        print("\nQ!")
+    except AssertionError as e:
+        print(f"\n✗ Test fehlgeschlagen: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Fehler: {e}")
+        sys.exit(1)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Hebrew Normalizer
+Testet Unicode-Normalisierung und Offset-Abbildung
+
+Stand: 29. Siwan 5785
+"""
+
+import random
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+# Füge Projekt-Root zum Python-Path hinzu
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from wwaq_system.validators.hebrew_normalizer import (
+    _DEPENDENT_RANGE, CANTILLATION, NIQQUD, HebrewNormalizer, _dependent_chars
+)
+from wwaq_system.validators.wwaq_validator import WWAQValidator
+
+# 'zerstört' mit kombinierendem Trema (o + U+0308)
+ZERSTOERT_NFD = "zersto\u0308rt"
+
+# 'Qabbala' auf Hebräisch mit Niqqud und Dagesch
+QABBALA_NIQQUD = "\u05e7\u05b7\u05d1\u05bc\u05b8\u05dc\u05b8\u05d4"
+
+
+def test_ascii_fast_path():
+    """Test ASCII-Text wird unverändert durchgereicht"""
+    normalized = HebrewNormalizer(strip_niqqud=True).normalize("Die Kabbala lehrt")
+
+    assert normalized.text == "Die Kabbala lehrt"
+    assert normalized.offsets is None
+    assert normalized.source_span(4, 11) == (4, 11)
+
+    print("✓ ASCII-Schnellpfad")
+
+
+def test_nfc_with_offsets():
+    """Test NFC-Normalisierung mit Rückabbildung"""
+    source = f"Er wurde {ZERSTOERT_NFD}."
+    normalized = HebrewNormalizer().normalize(source)
+
+    assert normalized.text == "Er wurde zerstört."
+    start = normalized.text.index("zerstört")
+    end = start + len("zerstört")
+    assert normalized.source_slice(start, end) == ZERSTOERT_NFD
+    assert normalized.to_source(len(normalized.text)) == len(source)
+
+    print("✓ NFC-Normalisierung mit Offsets")
+
+
+def test_matches_unicode_nfc():
+    """Test Ergebnis entspricht unicodedata NFC über gemischte Eingaben"""
+    fragments = [
+        'a', 'e', 'o', 'A', ' ', '\n', 'é', 'Å', 'ẛ',
+        '\u0301', '\u0308', '\u0323', '\u0327', '\u0344', '\u0345',
+        '\u1100', '\u1161', '\u11a8', '\uac00',             # Hangul-Jamo
+        '\u09c7', '\u09be', '\u0b47', '\u0b3e', '\u1b05', '\u1b35',  # indische Vokalzeichen
+        '\u0f71', '\u0f72', '\u0f73',                        # tibetische Zeichen
+        '\u05d1', '\u05bc', '\u05b8', '\u0591',              # Hebräisch mit Niqqud
+    ]
+    rng = random.Random(5785)
+
+    for strip in (False, True):
+        normalizer = HebrewNormalizer(strip_niqqud=strip, strip_cantillation=strip)
+        for _ in range(2000):
+            text = ''.join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+            normalized = normalizer.normalize(text)
+
+            expected = unicodedata.normalize('NFC', text)
+            if strip:
+                expected = expected.translate(dict.fromkeys(map(ord, NIQQUD + CANTILLATION)))
+            assert normalized.text == expected, f"Abweichung für {text!r}"
+
+            if normalized.offsets is not None:
+                assert len(normalized.offsets) == len(normalized.text) + 1
+                assert normalized.offsets == sorted(normalized.offsets)
+
+    print("✓ Entspricht unicodedata NFC")
+
+
+def test_offsets_inside_cluster():
+    """Test Offsets zusammengesetzter Cluster zeigen auf ihre Bestandteile"""
+    normalized = HebrewNormalizer().normalize("e\u0323\u0301x")
+
+    assert normalized.text == "\u1eb9\u0301x"
+    assert normalized.offsets == [0, 2, 3, 4]
+    assert normalized.source_slice(1, 2) == "\u0301"
+
+    hangul = HebrewNormalizer().normalize("\u1100\u1161 \u1100\u1161\u11a8")
+    assert hangul.text == "\uac00 \uac01"
+    assert hangul.source_slice(2, 3) == "\u1100\u1161\u11a8"
+
+    print("✓ Offsets innerhalb von Clustern")
+
+
+def test_long_combining_run():
+    """Test lange Folgen von Kombinationszeichen bleiben linear"""
+    normalizer = HebrewNormalizer()
+
+    mixed = "a" + "\u0301\u0323\u05b8\u0591" * 50 + "x"
+    normalized = normalizer.normalize(mixed)
+    assert normalized.text == unicodedata.normalize('NFC', mixed)
+    assert normalized.offsets == sorted(normalized.offsets)
+
+    zalgo = "e" + "\u0323\u0301" * 20000
+    start = time.perf_counter()
+    normalized = normalizer.normalize(zalgo)
+    elapsed = time.perf_counter() - start
+
+    assert normalized.text[0] == "\u1eb9"
+    assert len(normalized.text) == len(zalgo) - 1
+    assert elapsed < 1.0, f"Normalisierung zu langsam: {elapsed:.2f}s"
+
+    print("✓ Lange Kombinationsfolgen")
+
+
+def test_dependent_range_is_complete():
+    """Test außerhalb des Suchbereichs gibt es keine NFC-abhängigen Zeichen"""
+    outside = list(range(_DEPENDENT_RANGE.start)) + list(range(_DEPENDENT_RANGE.stop, 0x110000))
+    assert _dependent_chars(outside) == set()
+
+    print("✓ Suchbereich der Cluster-Zeichen vollständig")
+
+
+def test_strip_niqqud():
+    """Test Entfernen von Niqqud und Teamim"""
+    source = f"Die {QABBALA_NIQQUD}\u0591 Q!"
+
+    # Ohne Entfernen bleiben alle Zeichen erhalten (nur kanonisch geordnet)
+    kept = HebrewNormalizer().normalize(source)
+    assert sorted(kept.text) == sorted(source)
+
+    normalized = HebrewNormalizer(strip_niqqud=True, strip_cantillation=True).normalize(source)
+    assert normalized.text == "Die \u05e7\u05d1\u05dc\u05d4 Q!"
+    # Teamim gehören zum Cluster ihres Buchstabens
+    assert normalized.source_slice(4, 8) == QABBALA_NIQQUD + "\u0591"
+    assert normalized.source_slice(9, 11) == "Q!"
+
+    print("✓ Niqqud und Teamim entfernt")
+
+
+def test_validator_on_decomposed_text():
+    """Test Validator erkennt zerlegte Umlaute und meldet Original-Positionen"""
+    validator = WWAQValidator()
+    source = f"Der Tempel wurde {ZERSTOERT_NFD}, nach dem Tikkun."
+
+    result = validator.validate(source)
+    assert any('Zer-Präfix' in e for e in result.errors), "Zerlegter Umlaut nicht erkannt"
+    assert [source[s:e] for s, e in result.spans] == [ZERSTOERT_NFD, "Tikkun"]
+
+    transformed = validator.transform(source)
+    assert "gewandelt" in transformed
+    assert "Tiqqun" in transformed
+
+    print("✓ Validator arbeitet auf normalisiertem Text")
+
+
+def test_transform_preserves_source():
+    """Test Transformation ersetzt im Original, ohne Niqqud oder NFD zu verändern"""
+    validator = WWAQValidator(HebrewNormalizer(strip_niqqud=True))
+    source = f"{QABBALA_NIQQUD} Kabbala\nQ!"
+    assert validator.transform(source) == f"{QABBALA_NIQQUD} Qabbala\nQ!"
+
+    source = f"Ein {ZERSTOERT_NFD}er Text. Mo\u0308ge es in dir wachsen. Q!"
+    assert WWAQValidator().transform(source) == f"Ein {ZERSTOERT_NFD}er Text.Q!"
+
+    print("✓ Transformation erhält den Originaltext")
+
+
+if __name__ == "__main__":
+    print("\nHEBREW NORMALIZER TESTS")
+    print("="*40)
+
+    try:
+        test_ascii_fast_path()
+        test_nfc_with_offsets()
+        test_matches_unicode_nfc()
+        test_offsets_inside_cluster()
+        test_long_combining_run()
+        test_dependent_range_is_complete()
+        test_strip_niqqud()
+        test_validator_on_decomposed_text()
+        test_transform_preserves_source()
+
+        print("\n✓ Alle Normalisierungs-Tests bestanden!")
+        print("\nQ!")
+    except AssertionError as e:
+        print(f"\n✗ Test fehlgeschlagen: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Fehler: {e}")
+        sys.exit(1)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Result Stream
+Testet JSON Lines und SARIF Ausgabe
+
+Stand: 29. Siwan 5785
+"""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Füge Projekt-Root zum Python-Path hinzu
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from wwaq_system.validators.result_stream import (
+    JsonLinesWriter, LineIndex, SarifWriter, stream_validate
+)
+from wwaq_system.validators.wwaq_validator import RULES, WWAQValidator
+
+TEXT = "Die Kabbala lehrt.\nDie Kelim zerbrachen durch Tzimtzum."
+
+
+def test_structured_violations():
+    """Test strukturierte Verstöße mit Regel, Stufe und Position"""
+    result = WWAQValidator().validate(TEXT)
+
+    rules = [(v.rule, v.level) for v in result.violations]
+    assert ('zer-praefix', 'error') in rules
+    assert ('q-vs-k', 'error') in rules
+    assert ('din-31636', 'warning') in rules
+    assert ('q-ende', 'warning') in rules
+    assert all(v.rule in RULES for v in result.violations)
+
+    zer = next(v for v in result.violations if v.rule == 'zer-praefix')
+    assert TEXT[zer.start:zer.end] == "zerbrachen"
+
+    print("✓ Strukturierte Verstöße")
+
+
+def test_jsonl_per_violation():
+    """Test eine JSON-Zeile pro Verstoß"""
+    stream = io.StringIO()
+    with JsonLinesWriter(stream) as writer:
+        stream_validate([("a.md", TEXT), ("b.md", "Tiqqun.\n\nQ!")], writer)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(records) == 4
+    assert {r['document'] for r in records} == {"a.md"}
+
+    zer = next(r for r in records if r['rule'] == 'zer-praefix')
+    assert (zer['line'], zer['column']) == (2, 11)
+
+    print("✓ JSON Lines pro Verstoß")
+
+
+def test_jsonl_per_document():
+    """Test eine JSON-Zeile pro Dokument"""
+    stream = io.StringIO()
+    with JsonLinesWriter(stream, per_document=True) as writer:
+        summary = stream_validate((d for d in [("a.md", TEXT), ("b.md", "Q!")]), writer)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r['document'] for r in records] == ["a.md", "b.md"]
+    assert records[1]['valid'] and records[1]['violations'] == []
+    assert summary['documents'] == 2
+    assert summary['errors'] == 2
+
+    print("✓ JSON Lines pro Dokument")
+
+
+def test_buffered_writes():
+    """Test dass erst nach vollem Puffer geschrieben wird"""
+    stream = io.StringIO()
+    writer = JsonLinesWriter(stream, buffer_size=10)
+    writer.write("a.md", WWAQValidator().validate(TEXT))
+    assert stream.getvalue() == ""
+
+    writer.close()
+    assert len(stream.getvalue().splitlines()) == 4
+
+    print("✓ Gepufferte Ausgabe")
+
+
+def test_sarif_output():
+    """Test SARIF 2.1.0 Dokument"""
+    stream = io.StringIO()
+    with SarifWriter(stream, buffer_size=1) as writer:
+        writer.write("a.md", WWAQValidator().validate(TEXT), TEXT)
+        writer.write("b.md", WWAQValidator().validate("Q!"), "Q!")
+
+    sarif = json.loads(stream.getvalue())
+    run = sarif['runs'][0]
+    assert sarif['version'] == '2.1.0'
+    assert {r['id'] for r in run['tool']['driver']['rules']} == set(RULES)
+    assert len(run['results']) == 4
+
+    zer = next(r for r in run['results'] if r['ruleId'] == 'zer-praefix')
+    region = zer['locations'][0]['physicalLocation']['region']
+    assert (region['startLine'], region['startColumn']) == (2, 11)
+    assert region['charLength'] == len("zerbrachen")
+
+    uri = run['results'][0]['locations'][0]['physicalLocation']['artifactLocation']['uri']
+    assert uri == "a.md"
+
+    empty = io.StringIO()
+    SarifWriter(empty).close()
+    assert json.loads(empty.getvalue())['runs'][0]['results'] == []
+
+    print("✓ SARIF-Ausgabe")
+
+
+def test_sarif_uris():
+    """Test Dokumentpfade werden als gültige URIs ausgegeben"""
+    result = WWAQValidator().validate(TEXT)
+
+    for document, expected in [("docs/mein text.md", "docs/mein%20text.md"),
+                               ("100%.md", "100%25.md"),
+                               ("/tmp/a b.md", "file:///tmp/a%20b.md")]:
+        stream = io.StringIO()
+        with SarifWriter(stream) as writer:
+            writer.write(document, result, TEXT)
+        location = json.loads(stream.getvalue())['runs'][0]['results'][0]['locations'][0]
+        assert location['physicalLocation']['artifactLocation']['uri'] == expected
+
+    print("✓ SARIF-URIs")
+
+
+def test_cli_missing_file():
+    """Test fehlende Datei: Meldung auf stderr, SARIF bleibt gültig"""
+    completed = subprocess.run(
+        [sys.executable, str(project_root / "check_wwaq.py"), "--sarif",
+         str(project_root / "wwaq_checklist.md"), "gibt_es_nicht.md"],
+        capture_output=True, text=True, encoding='utf-8'
+    )
+
+    assert completed.returncode == 1
+    assert "Datei nicht gefunden: gibt_es_nicht.md" in completed.stderr
+    assert "Traceback" not in completed.stderr
+    sarif = json.loads(completed.stdout)
+    assert sarif['runs'][0]['results'], "Ergebnisse der vorhandenen Datei fehlen"
+
+    print("✓ Fehlende Datei im Stream-Modus")
+
+
+def test_line_index():
+    """Test Zeile/Spalte aus Zeichenposition"""
+    lines = LineIndex("ab\ncd\n\nef")
+
+    assert lines.position(0) == (1, 1)
+    assert lines.position(3) == (2, 1)
+    assert lines.position(7) == (4, 1)
+
+    print("✓ Zeilen-Index")
+
+
+if __name__ == "__main__":
+    print("\nRESULT STREAM TESTS")
+    print("="*40)
+
+    try:
+        test_structured_violations()
+        test_jsonl_per_violation()
+        test_jsonl_per_document()
+        test_buffered_writes()
+        test_sarif_output()
+        test_sarif_uris()
+        test_cli_missing_file()
+        test_line_index()
+
+        print("\n✓ Alle Stream-Tests bestanden!")
+        print("\nQ!")
+    except AssertionError as e:
+        print(f"\n✗ Test fehlgeschlagen: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Fehler: {e}")
+        sys.exit(1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAQ Kontext-Regeln
+Deklarative Kontext-Ausnahmen mit Intervall-Index
+
+Ausnahme-Anker (z.B. 'Berg', 'Centre') werden einmal pro Dokument
+gesucht und als sortierte Positionslisten abgelegt. Ob ein Treffer
+innerhalb von N Zeichen eines Ankers liegt, wird per Binärsuche
+beantwortet – ohne Kontext-Ausschnitt pro Treffer.
+
+Stand: 29. Siwan 5785
+Q! = Qawana! + DWEKUT!
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Tuple
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ContextException:
+    """Deklarative Kontext-Ausnahme einer Regel"""
+    anchors: Tuple[str, ...]
+    window: int = 50
+    case_sensitive: bool = True
+
+    def is_excepted(self, index: 'AnchorIndex', start: int, end: int) -> bool:
+        """
+        Prüft ob ein Treffer durch einen Anker in seiner Umgebung ausgenommen ist
+
+        Ein Anker zählt, wenn er vollständig im Fenster
+        [start - window, end + window) liegt.
+        """
+        return any(
+            index.near(anchor, start, end, self.window, self.case_sensitive)
+            for anchor in self.anchors
+        )
+
+
+class AnchorIndex:
+    """Sortierter Positions-Index aller Anker eines Dokuments"""
+
+    def __init__(self, text: str, exceptions: Iterable[ContextException] = ()):
+        self.text = text
+        self._positions: Dict[Tuple[str, bool], List[int]] = {}
+
+        for exception in exceptions:
+            for anchor in exception.anchors:
+                self._locate(anchor, exception.case_sensitive)
+
+    def _locate(self, anchor: str, case_sensitive: bool) -> List[int]:
+        """Sucht alle (auch überlappenden) Vorkommen eines Ankers einmalig"""
+        key = (anchor if case_sensitive else anchor.lower(), case_sensitive)
+        if key in self._positions:
+            return self._positions[key]
+
+        positions = []
+        if anchor and case_sensitive:
+            pos = self.text.find(anchor)
+            while pos != -1:
+                positions.append(pos)
+                pos = self.text.find(anchor, pos + 1)
+        elif anchor:
+            # Im Originaltext suchen: lower() kann die Länge ändern ('İ')
+            pattern = re.compile(f'(?={re.escape(anchor)})', re.IGNORECASE)
+            positions = [match.start() for match in pattern.finditer(self.text)]
+
+        # Beide Suchen liefern aufsteigende Positionen – bereits sortiert
+        self._positions[key] = positions
+        return positions
+
+    def near(self, anchor: str, start: int, end: int, window: int,
+             case_sensitive: bool = True) -> bool:
+        """
+        Prüft ob der Anker innerhalb von `window` Zeichen um [start, end) liegt
+
+        Args:
+            anchor: Gesuchter Anker
+            start: Startposition des Treffers
+            end: Endposition des Treffers
+            window: Fensterbreite in Zeichen
+
+        Returns:
+            True wenn ein Vorkommen vollständig im Fenster liegt
+        """
+        positions = self._locate(anchor, case_sensitive)
+        if not positions:
+            return False
+
+        low = max(0, start - window)
+        i = bisect_left(positions, low)
+        # Alle Vorkommen haben dieselbe Länge, daher genügt das erste
+        # Vorkommen ab `low`: liegt es nicht im Fenster, liegt keins darin.
+        return i < len(positions) and positions[i] + len(anchor) <= end + window
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAQ Äquivalenz-Prüfung
+Differenzieller Vergleich zwischen Referenz- und schneller Engine
+
+Jede Eingabe läuft durch beide Engines. Verglichen werden Fehler,
+Warnungen, Transformationen, Score, Gültigkeit und der transformierte
+Text; gleichzeitig wird das Geschwindigkeitsverhältnis gemessen.
+
+Dokumentierte Abweichungen (werden gezählt, nicht als Fehler gewertet):
+- Normalisierung: Die Referenz kennt keine Unicode-Normalisierung. Sie
+  erhält den Text daher NFC-normalisiert, die Ausgabe des Kandidaten
+  wird vor dem Vergleich ebenfalls NFC-normalisiert.
+- Mehrdeutige Transformation: Die Referenz ersetzt jedes Vorkommen
+  eines gemeldeten Begriffs, auch ausgenommene oder doppelt gezählte.
+  Der Kandidat ersetzt genau die gemeldeten Stellen. In diesen Fällen
+  wird der Erwartungswert aus den gemeldeten Stellen der Referenz
+  gebildet und streng mit dem Kandidaten verglichen.
+
+Verwendung: python3 -m wwaq_system.validators.equivalence [--min-ratio X] [dateien...]
+(Standard: --min-ratio 1.0, d.h. der Kandidat darf nicht langsamer sein)
+
+Stand: 29. Siwan 5785
+Q! = Qawana! + DWEKUT!
+"""
+
+import random
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+try:
+    from .reference_validator import ReferenceWWAQValidator
+    from .wwaq_validator import WWAQValidator
+except ImportError:  # Direkter Aufruf als Skript
+    from reference_validator import ReferenceWWAQValidator
+    from wwaq_validator import WWAQValidator
+
+
+# Mindestverhältnis Referenzzeit / Kandidatenzeit für die CLI
+DEFAULT_MIN_RATIO = 1.0
+
+# Verglichene Felder des ValidationResult
+COMPARED_FIELDS = ('is_valid', 'score', 'errors', 'warnings', 'transformations')
+
+# Füllwörter für generierte Eingaben
+_FILLER = [
+    'Die', 'der', 'und', 'lehrt', 'Licht', 'Gefäße', 'uns', 'über', 'Einheit',
+    'Berg', 'Centre', 'Kelim', 'Baal', 'HaSulam', 'Weg', 'Qabbala', 'Tiqqun'
+]
+
+# Hebräische Fragmente mit Niqqud und Teamim
+_HEBREW = [
+    '\u05e7\u05b7\u05d1\u05bc\u05b8\u05dc\u05b8\u05d4',  # Qabbala mit Niqqud
+    '\u05e9\u05b8\u05c1\u05dc\u05d5\u05b9\u05dd',        # Schalom mit Niqqud
+    '\u05d1\u05bc\u05b0\u05e8\u05b5\u05d0\u05e9\u05c1\u0596\u05d9\u05ea',  # mit Tipcha
+    '\u05ea\u05bc\u05b4\u05e7\u05bc\u05d5\u05bc\u05df',  # Tiqqun
+]
+
+# Satzzeichen und Trenner für generierte Eingaben
+_SEPARATORS = [' ', ' ', ' ', '  ', '\n', ', ', '. ', '! ', '? ', '-', '_', "'"]
+
+
+@dataclass
+class EquivalenceReport:
+    """Ergebnis eines Äquivalenz-Laufs"""
+    cases: int = 0
+    mismatches: List[str] = field(default_factory=list)
+    # Dokumentierte, erwartete Abweichungen (s. Modul-Docstring)
+    expected: List[str] = field(default_factory=list)
+    reference_seconds: float = 0.0
+    candidate_seconds: float = 0.0
+
+    @property
+    def equivalent(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def speed_ratio(self) -> float:
+        """Referenzzeit / Kandidatenzeit (> 1 bedeutet schneller)"""
+        if self.candidate_seconds <= 0:
+            return float('inf')
+        return self.reference_seconds / self.candidate_seconds
+
+
+def _vary_case(word: str, rng: random.Random) -> str:
+    """Zufällige Schreibweise eines Wortes"""
+    choice = rng.randrange(4)
+    if choice == 0:
+        return word.upper()
+    if choice == 1:
+        return word.capitalize()
+    if choice == 2:
+        return word.lower()
+    return ''.join(c.upper() if rng.random() < 0.5 else c for c in word)
+
+
+def generate_texts(count: int, seed: int = 5785,
+                   validator: Optional[WWAQValidator] = None) -> List[str]:
+    """
+    Erzeugt zufällige Eingaben aus dem Regel-Vokabular
+
+    Die Texte mischen Regel-Begriffe, Ausnahme-Anker, verbotene Phrasen,
+    Emojis, hebräische Fragmente und Satzzeichen in wechselnder
+    Schreibweise; Wörter erscheinen teils zerlegt (NFD). Gleicher Seed
+    liefert gleiche Texte.
+
+    Args:
+        count: Anzahl der Texte
+        seed: Startwert des Zufallsgenerators
+        validator: Quelle des Vokabulars (Standard: WWAQValidator)
+
+    Returns:
+        Liste generierter Texte
+    """
+    rng = random.Random(seed)
+    validator = validator or WWAQValidator()
+
+    vocabulary = (
+        list(validator.zer_transformations)
+        + list(validator.q_vs_k_terms)
+        + list(validator.din_corrections)
+        + list(validator.din_corrections.values())
+        + list(validator.forbidden_phrases)
+        + [anchor for exception in validator.context_exceptions.values()
+           for anchor in exception.anchors]
+    )
+    extras = ['Q!', '❤️', '✨', '😀', 'Kabbalist', 'zerbrachenen', 'x' * 40] + _HEBREW
+
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(0, 30)):
+            roll = rng.random()
+            if roll < 0.45:
+                word = _vary_case(rng.choice(vocabulary), rng)
+            elif roll < 0.9:
+                word = rng.choice(_FILLER)
+            else:
+                word = rng.choice(extras)
+            if rng.random() < 0.2:
+                word = unicodedata.normalize('NFD', word)
+            parts.append(word)
+            parts.append(rng.choice(_SEPARATORS))
+        text = ''.join(parts)
+        if rng.random() < 0.3:
+            text += rng.choice(['Q!', '\n\nQ!', ' Q! ', 'q!'])
+        texts.append(text)
+    return texts
+
+
+def corpus_texts(paths: Iterable[str]) -> List[str]:
+    """Liest Korpus-Dateien (Text/Markdown) als Eingaben"""
+    texts = []
+    for path in paths:
+        texts.append(Path(path).read_text(encoding='utf-8'))
+    return texts
+
+
+def _ambiguous_transform(text: str, transformations: List[Tuple[str, str]]) -> bool:
+    """Prüft ob die Referenz mehr Stellen ersetzt als sie gemeldet hat"""
+    positions = [
+        match.span()
+        for original, _ in transformations
+        for match in re.finditer(rf'\b{re.escape(original)}\b', text, re.IGNORECASE)
+    ]
+    return len(positions) != len(transformations) or len(set(positions)) != len(positions)
+
+
+def _transform_reported(reference: WWAQValidator, text: str, validation) -> str:
+    """Erwartete Transformation: nur die gemeldeten Stellen der Referenz ersetzen"""
+    transformed = text
+    last = len(text) + 1
+    for (start, end), (original, replacement) in sorted(
+            zip(validation.spans, validation.transformations), reverse=True):
+        if end > last:
+            continue  # Überlappende Treffer nur einmal ersetzen
+        if transformed[start].isupper():
+            replacement = replacement[0].upper() + replacement[1:]
+        transformed = transformed[:start] + replacement + transformed[end:]
+        last = start
+    return reference._finish_transform(transformed)
+
+
+def compare(text: str, reference: WWAQValidator,
+            candidate: WWAQValidator) -> Tuple[List[str], List[str]]:
+    """
+    Vergleicht beide Engines für einen Text
+
+    Returns:
+        (Abweichungen, dokumentierte Abweichungen) – beide leer wenn identisch
+    """
+    diffs = []
+    documented = []
+
+    # Die Referenz normalisiert nicht selbst
+    reference_text = unicodedata.normalize('NFC', text)
+    if reference_text != text:
+        documented.append("Normalisierung: Eingabe nicht NFC")
+
+    expected = reference.validate(reference_text)
+    actual = candidate.validate(text)
+
+    for name in COMPARED_FIELDS:
+        if getattr(expected, name) != getattr(actual, name):
+            diffs.append(
+                f"{name}: Referenz={getattr(expected, name)!r} Kandidat={getattr(actual, name)!r}"
+            )
+
+    expected_text = reference.transform(reference_text)
+    if _ambiguous_transform(reference_text, expected.transformations):
+        reported_text = _transform_reported(reference, reference_text, expected)
+        if reported_text != expected_text:
+            documented.append("Mehrdeutige Transformation der Referenz")
+        expected_text = reported_text
+
+    actual_text = unicodedata.normalize('NFC', candidate.transform(text))
+    if expected_text != actual_text:
+        diffs.append(f"transform: Referenz={expected_text!r} Kandidat={actual_text!r}")
+
+    return diffs, documented
+
+
+def _time_engine(engine: WWAQValidator, texts: List[str], repeat: int = 3) -> float:
+    """Misst Validierung und Transformation aller Texte (bester von `repeat` Läufen)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            engine.validate(text)
+            engine.transform(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_equivalence(texts: Iterable[str],
+                    candidate: Optional[WWAQValidator] = None,
+                    reference: Optional[WWAQValidator] = None) -> EquivalenceReport:
+    """
+    Führt den differenziellen Vergleich über alle Eingaben aus
+
+    Args:
+        texts: Eingabetexte
+        candidate: Zu prüfende Engine (Standard: WWAQValidator ohne
+            Vorschläge – die Referenz erzeugt keine, so wird gleiche
+            Arbeit gemessen)
+        reference: Referenz-Engine (Standard: ReferenceWWAQValidator)
+
+    Returns:
+        EquivalenceReport mit Abweichungen und Laufzeiten
+    """
+    texts = list(texts)
+    candidate = candidate or WWAQValidator(suggestions=False)
+    reference = reference or ReferenceWWAQValidator()
+    report = EquivalenceReport(cases=len(texts))
+
+    for i, text in enumerate(texts):
+        diffs, documented = compare(text, reference, candidate)
+        for diff in diffs:
+            report.mismatches.append(f"Fall {i} ({text[:40]!r}): {diff}")
+        for note in documented:
+            report.expected.append(f"Fall {i}: {note}")
+
+    # Beide Engines erhalten dieselben Eingaben wie im Vergleich
+    report.reference_seconds = _time_engine(
+        reference, [unicodedata.normalize('NFC', text) for text in texts]
+    )
+    report.candidate_seconds = _time_engine(candidate, texts)
+
+    return report
+
+
+def main():
+    args = sys.argv[1:]
+    min_ratio = DEFAULT_MIN_RATIO
+    if args[:1] == ['--min-ratio']:
+        min_ratio = float(args[1])
+        args = args[2:]
+
+    texts = generate_texts(500) + corpus_texts(args)
+    report = run_equivalence(texts)
+
+    print(f"Fälle: {report.cases}")
+    print(f"Referenz: {report.reference_seconds:.3f}s")
+    print(f"Kandidat: {report.candidate_seconds:.3f}s")
+    print(f"Verhältnis: {report.speed_ratio:.2f}x")
+    print(f"Dokumentierte Abweichungen: {len(report.expected)}")
+
+    if report.mismatches:
+        print(f"\n{len(report.mismatches)} Abweichungen:")
+        for mismatch in report.mismatches[:20]:
+            print(f"❌ {mismatch}")
+        sys.exit(1)
+
+    if report.speed_ratio < min_ratio:
+        print(f"\n❌ Kandidat zu langsam: {report.speed_ratio:.2f}x < {min_ratio:.2f}x")
+        sys.exit(1)
+
+    print("\n✓ Engines sind äquivalent")
+    print("\nQ!")
+
+
+if __name__ == "__main__":
+    main()
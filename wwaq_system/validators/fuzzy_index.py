@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAQ Fuzzy-Index
+Erkennt Beinahe-Treffer falscher Transliterationen
+
+Löschungs-Wörterbuch nach dem SymSpell-Prinzip: Für jeden Eintrag
+werden alle Varianten mit bis zu `max_distance` gelöschten Zeichen
+vorab gespeichert. Ein Token wird dann über seine eigenen Löschungen
+nachgeschlagen – unabhängig von der Größe des Vokabulars.
+
+Kurze Tokens liegen oft eine Änderung von gewöhnlichen deutschen
+Wörtern entfernt ('Meter' – 'Keter', 'Hafer' – 'Haver'). Für sie zählt
+daher nur ein eingefügter oder fehlender Vokal, ein 'h' oder ein
+verdoppelter Buchstabe – typisch für Transliterationen ('Tikoun',
+'Jesod').
+
+Stand: 29. Siwan 5785
+Q! = Qawana! + DWEKUT!
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from dataclasses import dataclass
+
+
+# Die zehn Sefirot in DIN 31636-konformer Schreibweise
+SEFIROT = [
+    'Keter', 'Chochma', 'Bina', 'Chessed', 'Gewura',
+    'Tiferet', 'Nezach', 'Hod', 'Jessod', 'Malchut'
+]
+
+# Zeichen, deren Einfügen/Weglassen bei kurzen Tokens als Beinahe-Treffer gilt
+SOFT_LETTERS = frozenset('aeiouyäöüh')
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """Beinahe-Treffer eines Tokens im WWAQ-Vokabular"""
+    token: str
+    term: str
+    canonical: str
+    distance: int
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """Alle Varianten eines Wortes mit bis zu max_distance Löschungen"""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+def _is_soft_edit(a: str, b: str) -> bool:
+    """Prüft ob a und b sich nur um einen Vokal, ein 'h' oder eine Verdopplung unterscheiden"""
+    if abs(len(a) - len(b)) != 1:
+        return False
+    longer, shorter = (a, b) if len(a) > len(b) else (b, a)
+
+    i = 0
+    while i < len(shorter) and longer[i] == shorter[i]:
+        i += 1
+    if longer[i + 1:] != shorter[i:]:
+        return False
+
+    extra = longer[i]
+    return (extra in SOFT_LETTERS
+            or (i > 0 and longer[i - 1] == extra)
+            or (i + 1 < len(longer) and longer[i + 1] == extra))
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein-Distanz (Optimal String Alignment) mit Abbruch"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = None
+    current = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous = previous, current
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2]
+                    and a[i - 2] == b[j - 1]):
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+    return current[len(b)]
+
+
+class FuzzyTermIndex:
+    """Löschungs-Index über das kanonische WWAQ-Vokabular"""
+
+    def __init__(self, max_distance: int = 1, min_length: int = 5, short_length: int = 7):
+        self.max_distance = max_distance
+        self.min_length = min_length
+        # Tokens kürzer als short_length nur mit weicher Änderung (s. oben)
+        self.short_length = short_length
+        # Eintrag (klein geschrieben) → kanonische Schreibweise
+        self.terms: Dict[str, str] = {}
+        # Löschvariante → Einträge, aus denen sie entsteht
+        self._deletes: Dict[str, Set[str]] = {}
+
+    def add(self, term: str, canonical: str):
+        """Nimmt einen Eintrag (Variante oder korrekte Form) auf"""
+        key = term.lower()
+        if ' ' in key or key in self.terms:
+            return
+        self.terms[key] = canonical
+        for variant in _deletes(key, self.max_distance):
+            self._deletes.setdefault(variant, set()).add(key)
+
+    def add_mapping(self, mapping: Mapping[str, str]):
+        """Nimmt Korrektur-Tabelle auf: Varianten und ihre Zielformen"""
+        for wrong, correct in mapping.items():
+            self.add(correct, correct)
+            self.add(wrong, correct)
+
+    def add_terms(self, terms: Iterable[str]):
+        """Nimmt korrekte Schreibweisen auf"""
+        for term in terms:
+            self.add(term, term)
+
+    def lookup(self, token: str) -> Optional[FuzzyMatch]:
+        """
+        Sucht den nächsten Eintrag zu einem Token
+
+        Args:
+            token: Zu prüfendes Wort
+
+        Returns:
+            FuzzyMatch oder None bei exaktem Treffer / keinem Treffer
+        """
+        key = token.lower()
+        if len(key) < self.min_length or key in self.terms:
+            return None
+
+        candidates: Set[str] = set()
+        for variant in _deletes(key, self.max_distance):
+            candidates |= self._deletes.get(variant, set())
+
+        best: Optional[Tuple[int, str]] = None
+        short = len(key) < self.short_length
+        for candidate in candidates:
+            if short and not _is_soft_edit(key, candidate):
+                continue
+            distance = _edit_distance(key, candidate, self.max_distance)
+            if distance <= self.max_distance and (best is None or (distance, candidate) < best):
+                best = (distance, candidate)
+
+        if best is None:
+            return None
+        return FuzzyMatch(token, best[1], self.terms[best[1]], best[0])
+
+    def scan(self, tokens: Iterable[str]) -> List[FuzzyMatch]:
+        """Prüft eine Token-Folge, jedes unterschiedliche Wort nur einmal"""
+        cache: Dict[str, Optional[FuzzyMatch]] = {}
+        matches = []
+        for token in tokens:
+            if token not in cache:
+                cache[token] = self.lookup(token)
+            if cache[token] is not None:
+                matches.append(cache[token])
+        return matches
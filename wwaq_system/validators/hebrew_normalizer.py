@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAQ Hebräisch-Normalisierung
+Unicode-Vorverarbeitung für deutsch-hebräische Quelltexte
+
+Vorstufe des Moduls 10.1.5 (Hebräische Wurzeln): NFC-Normalisierung
+(z.B. 'zerstört' mit kombinierendem Trema), optionales Entfernen von
+Niqqud und Teamim sowie eine Offset-Tabelle zurück zum Originaltext.
+Reiner ASCII-Text und bereits normalisierter Text ohne zu entfernende
+Zeichen werden unverändert durchgereicht.
+
+Stand: 29. Siwan 5785
+Q! = Qawana! + DWEKUT!
+"""
+
+import re
+import unicodedata
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+from dataclasses import dataclass
+
+
+# Teamim (Kantillationszeichen) U+0591–U+05AF
+CANTILLATION = [chr(c) for c in range(0x0591, 0x05AF + 1)]
+
+# Niqqud (Vokalzeichen, Dagesch, Schin-/Sin-Punkt, Rafe) U+05B0–U+05C7
+NIQQUD = [chr(c) for c in range(0x05B0, 0x05BD + 1)] + [
+    chr(c) for c in (0x05BF, 0x05C1, 0x05C2, 0x05C4, 0x05C5, 0x05C7)
+]
+
+
+@dataclass
+class NormalizedText:
+    """Normalisierter Text mit Abbildung auf Positionen im Original"""
+    source: str
+    text: str
+    # offsets[i] = Position im Original, an der Zeichen i beginnt;
+    # letzter Eintrag = len(source). None bedeutet identische Positionen.
+    offsets: Optional[List[int]] = None
+
+    def to_source(self, pos: int) -> int:
+        """Bildet eine Position im normalisierten Text auf das Original ab"""
+        if self.offsets is None:
+            return pos
+        return self.offsets[pos]
+
+    def source_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Bildet einen Bereich [start, end) auf das Original ab"""
+        return self.to_source(start), self.to_source(end)
+
+    def source_slice(self, start: int, end: int) -> str:
+        """Originaltext zu einem Bereich im normalisierten Text"""
+        source_start, source_end = self.source_span(start, end)
+        return self.source[source_start:source_end]
+
+
+class HebrewNormalizer:
+    """NFC-Normalisierung mit optionalem Entfernen von Niqqud und Teamim"""
+
+    def __init__(self, strip_niqqud: bool = False, strip_cantillation: bool = False):
+        self.strip_niqqud = strip_niqqud
+        self.strip_cantillation = strip_cantillation
+
+        removed = (NIQQUD if strip_niqqud else []) + (CANTILLATION if strip_cantillation else [])
+        self._strip_table: Dict[int, None] = dict.fromkeys(map(ord, removed))
+
+    def normalize(self, text: str) -> NormalizedText:
+        """
+        Normalisiert einen Text
+
+        Args:
+            text: Originaltext
+
+        Returns:
+            NormalizedText mit Offset-Tabelle
+        """
+        # Schnellpfad: ASCII ist bereits NFC und enthält kein Hebräisch
+        if text.isascii():
+            return NormalizedText(text, text)
+
+        if unicodedata.is_normalized('NFC', text):
+            stripped = text.translate(self._strip_table) if self._strip_table else text
+            if len(stripped) == len(text):
+                return NormalizedText(text, text)
+            # Nur Entfernen: eine translate-Runde, Offsets der verbliebenen Zeichen
+            offsets = [i for i, ch in enumerate(text) if ord(ch) not in self._strip_table]
+            offsets.append(len(text))
+            return NormalizedText(text, stripped, offsets)
+
+        return self._normalize_clusters(text)
+
+    def _normalize_clusters(self, text: str) -> NormalizedText:
+        """Normalisiert nur Cluster, die unter NFC zusammenwirken können"""
+        parts = []
+        offsets = []
+        last = 0
+
+        # Cluster: Basiszeichen + Zeichen, die mit ihm verschmelzen oder umsortiert werden
+        for match in _CLUSTER_PATTERN.finditer(text):
+            cluster_start, cluster_end = match.span()
+            cluster = match.group()
+            normalized = _nfc(cluster)
+            if normalized == cluster:
+                continue
+
+            if len(normalized) == 1:
+                cluster_offsets = [cluster_start]
+            else:
+                cluster_offsets = _align(cluster, normalized, cluster_start)
+
+            parts.append(text[last:cluster_start])
+            offsets.extend(range(last, cluster_start))
+            parts.append(normalized)
+            offsets.extend(cluster_offsets)
+            last = cluster_end
+
+        parts.append(text[last:])
+        offsets.extend(range(last, len(text)))
+        normalized_text = ''.join(parts)
+
+        if self._strip_table:
+            kept = [j for j, ch in enumerate(normalized_text) if ord(ch) not in self._strip_table]
+            normalized_text = normalized_text.translate(self._strip_table)
+            offsets = [offsets[j] for j in kept]
+
+        offsets.append(len(text))
+        return NormalizedText(text, normalized_text, offsets)
+
+
+# Bereich, in dem Unicode Kombinationszeichen und kanonische Zerlegungen
+# mit Kombinationszeichen vergibt (darunter nur Latin-1, darüber nur
+# CJK-Kompatibilitätszeichen mit einteiliger Zerlegung)
+_DEPENDENT_RANGE = range(0x0300, 0x20000)
+
+
+def _dependent_chars(codepoints: Iterable[int]) -> Set[int]:
+    """
+    Zeichen, vor denen NFC nicht stabil ist
+
+    Dazu gehören Kombinationszeichen, Zeichen deren Zerlegung mit einem
+    Kombinationszeichen beginnt, sowie Zeichen der Klasse 0, die mit
+    ihrem Vorgänger verschmelzen (Hangul-Jamo, einige indische
+    Vokalzeichen).
+    """
+    dependent = set()
+    for cp in codepoints:
+        ch = chr(cp)
+        if unicodedata.combining(ch):
+            dependent.add(cp)
+            continue
+        decomposition = unicodedata.decomposition(ch)
+        if not decomposition or decomposition.startswith('<'):
+            continue
+        parts = [chr(int(x, 16)) for x in decomposition.split()]
+        if unicodedata.combining(unicodedata.normalize('NFD', parts[0])[0]):
+            dependent.add(cp)
+        if (len(parts) == 2 and not unicodedata.combining(parts[1])
+                and unicodedata.normalize('NFC', parts[0] + parts[1]) == ch):
+            dependent.add(ord(parts[1]))
+    return dependent
+
+
+def _build_cluster_pattern() -> Pattern:
+    """Regex für NFC-abhängige Cluster: Basiszeichen + abhängige Zeichen"""
+    dependent = _dependent_chars(_DEPENDENT_RANGE)
+    # Hangul-Jamo (Vokale und Schlusskonsonanten) setzen sich algorithmisch zusammen
+    dependent.update(range(0x1161, 0x1175 + 1))
+    dependent.update(range(0x11A8, 0x11C2 + 1))
+
+    ranges = []
+    for cp in sorted(dependent):
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    char_class = ''.join(
+        re.escape(chr(a)) if a == b else f'{re.escape(chr(a))}-{re.escape(chr(b))}'
+        for a, b in ranges
+    )
+    return re.compile(f'[^{char_class}]?[{char_class}]+', re.DOTALL)
+
+
+# Einmalig beim Import erzeugt
+_CLUSTER_PATTERN = _build_cluster_pattern()
+
+
+# Ab dieser Clusterlänge wird vor NFC selbst kanonisch sortiert
+_LONG_CLUSTER = 32
+
+
+def _nfc(cluster: str) -> str:
+    """
+    NFC eines Clusters, auch bei langen Folgen von Kombinationszeichen linear
+
+    unicodedata sortiert Kombinationszeichen paarweise um (quadratisch in
+    der Länge). Lange Cluster werden daher zeichenweise zerlegt und jede
+    Folge von Kombinationszeichen stabil nach Klasse sortiert; auf bereits
+    kanonisch geordneter Eingabe ist NFC linear.
+    """
+    if len(cluster) < _LONG_CLUSTER:
+        return unicodedata.normalize('NFC', cluster)
+
+    ordered = []
+    marks = []
+    for ch in cluster:
+        for part in unicodedata.normalize('NFD', ch):
+            if unicodedata.combining(part):
+                marks.append(part)
+                continue
+            if marks:
+                ordered.extend(sorted(marks, key=unicodedata.combining))
+                marks = []
+            ordered.append(part)
+    ordered.extend(sorted(marks, key=unicodedata.combining))
+    return unicodedata.normalize('NFC', ''.join(ordered))
+
+
+def _align(cluster: str, normalized: str, cluster_start: int) -> List[int]:
+    """
+    Ordnet jedem NFC-Zeichen die Quellposition seines ersten Bestandteils zu
+
+    Beispiel: 'e' + U+0323 + U+0301 wird zu 'ẹ' + U+0301 mit Offsets [0, 2].
+    Linear in der Clusterlänge: je Bestandteil eine Warteschlange der
+    Quellpositionen in Textreihenfolge.
+    """
+    # Zerlegte Bestandteile mit Herkunft (Position im Cluster)
+    pool: Dict[str, Deque[int]] = defaultdict(deque)
+    for j, ch in enumerate(cluster):
+        for part in unicodedata.normalize('NFD', ch):
+            pool[part].append(j)
+
+    offsets = []
+    previous = cluster_start
+    for ch in normalized:
+        origin = None
+        for part in unicodedata.normalize('NFD', ch):
+            sources = pool.get(part)
+            if sources:
+                j = sources.popleft()
+                if origin is None:
+                    origin = j
+        position = cluster_start + origin if origin is not None else previous
+        # Offsets bleiben monoton, damit Bereiche gültig sind
+        previous = max(previous, position)
+        offsets.append(previous)
+    return offsets
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAQ Referenz-Validator
+Eingefrorene Regex-Implementierung als Vergleichsbasis
+
+Diese Klasse hält den ursprünglichen Algorithmus (eine Regex-Suche pro
+Begriff, Kontext-Ausschnitt pro Treffer) unverändert fest. Die
+Regel-Tabellen werden vom WWAQValidator geerbt, damit neue Regeln in
+beiden Engines gelten. Hier NICHT optimieren – jede schnellere Engine
+muss gegen diese Referenz identische Ergebnisse liefern.
+
+Stand: 29. Siwan 5785
+Q! = Qawana! + DWEKUT!
+"""
+
+import re
+
+try:
+    from .wwaq_validator import ValidationResult, WWAQValidator
+except ImportError:  # Direkter Aufruf als Skript
+    from wwaq_validator import ValidationResult, WWAQValidator
+
+
+class ReferenceWWAQValidator(WWAQValidator):
+    """Eingefrorene Referenz-Implementierung der WWAQ-Validierung"""
+
+    def validate(self, text: str) -> ValidationResult:
+        """Validiert einen Text mit dem Referenz-Algorithmus"""
+        result = ValidationResult()
+
+        self._check_zer_prefixes(text, result)
+        self._check_q_vs_k(text, result)
+        self._check_anthropomorphisms(text, result)
+        self._check_din_conformity(text, result)
+        self._check_q_ending(text, result)
+
+        total_issues = len(result.errors) + (len(result.warnings) * 0.5)
+        result.score = max(0, 100 - (total_issues * 10))
+        result.is_valid = len(result.errors) == 0
+
+        return result
+
+    def _in_excepted_context(self, rule: str, text: str, start: int, end: int) -> bool:
+        """Prüft die Kontext-Ausnahme einer Regel per Ausschnitt um den Treffer"""
+        exception = self.context_exceptions.get(rule)
+        if exception is None:
+            return False
+
+        context = text[max(0, start-exception.window):end+exception.window]
+        if not exception.case_sensitive:
+            context = context.lower()
+        return any((anchor if exception.case_sensitive else anchor.lower()) in context
+                   for anchor in exception.anchors)
+
+    def _check_zer_prefixes(self, text: str, result: ValidationResult, anchor_index=None):
+        """Prüft auf Zer-Präfixe"""
+        for zer_word, replacement in self.zer_transformations.items():
+            pattern = rf'\b{zer_word}\b'
+            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+
+            for match in matches:
+                if self._in_excepted_context('zer-praefix', text, match.start(), match.end()):
+                    continue
+                result.errors.append(
+                    f"Zer-Präfix gefunden: '{match.group()}' → sollte '{replacement}' sein"
+                )
+                result.transformations.append((match.group(), replacement))
+                result.spans.append(match.span())
+
+    def _check_q_vs_k(self, text: str, result: ValidationResult, anchor_index=None):
+        """Prüft Q vs K Unterscheidung mit Kontext-Ausschnitt pro Treffer"""
+        for k_term, q_term in self.q_vs_k_terms.items():
+            pattern = rf'\b{k_term}\b'
+            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+
+            for match in matches:
+                if self._in_excepted_context('q-vs-k', text, match.start(), match.end()):
+                    continue
+                result.errors.append(
+                    f"K statt Q: '{match.group()}' → sollte '{q_term}' sein"
+                )
+                result.transformations.append((match.group(), q_term))
+                result.spans.append(match.span())
+
+    def _check_anthropomorphisms(self, text: str, result: ValidationResult, anchor_index=None):
+        """Prüft auf anthropomorphe Ausdrücke"""
+        text_lower = text.lower()
+
+        for phrase in self.forbidden_phrases:
+            if phrase in text_lower:
+                # Ohne verlässliche Positionen gilt keine Ausnahme
+                if len(text_lower) == len(text) and all(
+                        self._in_excepted_context('anthropomorphismus', text,
+                                                  match.start(), match.start() + len(phrase))
+                        for match in re.finditer(f'(?={re.escape(phrase)})', text_lower)):
+                    continue
+                result.errors.append(
+                    f"Anthropomorphismus gefunden: '{phrase}'"
+                )
+
+        emoji_pattern = re.compile(r'[😀-🙏]|❤️|💕|💖|✨|🌟|⭐')
+        for match in emoji_pattern.finditer(text):
+            if not self._in_excepted_context('emoji', text, match.start(), match.end()):
+                result.errors.append("Emojis sind nicht WWAQ-konform")
+                break
+
+    def _check_din_conformity(self, text: str, result: ValidationResult, anchor_index=None):
+        """Prüft DIN 31636 Konformität"""
+        for wrong, correct in self.din_corrections.items():
+            pattern = rf'\b{wrong}\b'
+            matches = list(re.finditer(pattern, text, re.IGNORECASE))
+
+            for match in matches:
+                if self._in_excepted_context('din-31636', text, match.start(), match.end()):
+                    continue
+                result.warnings.append(
+                    f"DIN 31636: '{match.group()}' → sollte '{correct}' sein"
+                )
+                result.transformations.append((match.group(), correct))
+                result.spans.append(match.span())
+
+    def _check_q_ending(self, text: str, result: ValidationResult):
+        """Prüft auf Q! am Ende"""
+        if not text.strip().endswith("Q!"):
+            result.warnings.append("Text sollte mit 'Q!' enden")
+
+    def transform(self, text: str) -> str:
+        """Transformiert einen Text mit dem Referenz-Algorithmus"""
+        validation = self.validate(text)
+
+        transformed = text
+        all_transforms = []
+
+        for original, replacement in validation.transformations:
+            for match in re.finditer(rf'\b{re.escape(original)}\b', transformed, re.IGNORECASE):
+                all_transforms.append((match.start(), match.end(), original, replacement))
+
+        for start, end, original, replacement in sorted(all_transforms, reverse=True):
+            if transformed[start].isupper():
+                replacement = replacement[0].upper() + replacement[1:]
+
+            transformed = transformed[:start] + replacement + transformed[end:]
+
+        return self._finish_transform(transformed)
+
+    def _finish_transform(self, transformed: str) -> str:
+        """Entfernt Phrasen und Emojis und ergänzt Q! (nach den Ersetzungen)"""
+        for phrase in self.forbidden_phrases:
+            pattern = rf'[^.!?]*{re.escape(phrase)}[^.!?]*[.!?]\s*'
+            transformed = re.sub(pattern, '', transformed, flags=re.IGNORECASE)
+
+        emoji_pattern = re.compile(r'[😀-🙏]|❤️|💕|💖|✨|🌟|⭐')
+        transformed = emoji_pattern.sub('', transformed)
+
+        if not transformed.strip().endswith("Q!"):
+            transformed = transformed.rstrip() + "\n\nQ!"
+
+        return transformed
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WWAQ Ergebnis-Stream
+Maschinenlesbare Ausgabe als JSON Lines und SARIF
+
+Ergebnisse werden geschrieben, sobald sie vorliegen: pro Verstoß oder
+pro Dokument eine JSON-Zeile bzw. ein SARIF-Result. Gepuffert wird nur
+eine feste Anzahl Zeilen, nie die gesamte Ergebnismenge.
+
+Stand: 29. Siwan 5785
+Q! = Qawana! + DWEKUT!
+"""
+
+import json
+from bisect import bisect_right
+from pathlib import Path
+from urllib.parse import quote
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+try:
+    from .wwaq_validator import RULES, ValidationResult, Violation, WWAQValidator
+except ImportError:  # Direkter Aufruf als Skript
+    from wwaq_validator import RULES, ValidationResult, Violation, WWAQValidator
+
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+class LineIndex:
+    """Bildet Zeichenpositionen auf Zeile/Spalte ab (1-basiert)"""
+
+    def __init__(self, text: str):
+        self._starts = [0]
+        pos = text.find('\n')
+        while pos != -1:
+            self._starts.append(pos + 1)
+            pos = text.find('\n', pos + 1)
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        line = bisect_right(self._starts, offset)
+        return line, offset - self._starts[line - 1] + 1
+
+
+class _BufferedWriter:
+    """Gemeinsame Pufferung: schreibt nach `buffer_size` Einträgen durch"""
+
+    def __init__(self, stream: TextIO, buffer_size: int = 256):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._buffer: List[str] = []
+
+    def _emit(self, chunk: str):
+        self._buffer.append(chunk)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self.stream.write(''.join(self._buffer))
+            self._buffer.clear()
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _artifact_uri(document: str) -> str:
+    """SARIF-URI eines Dokumentpfads (Schrägstriche, Prozent-Kodierung)"""
+    path = Path(document)
+    if path.is_absolute():
+        return path.as_uri()
+    return quote(path.as_posix())
+
+
+def _violation_record(document: str, violation: Violation,
+                      lines: Optional[LineIndex]) -> Dict:
+    """JSON-Datensatz eines Verstoßes"""
+    record = {
+        'document': document,
+        'rule': violation.rule,
+        'level': violation.level,
+        'message': violation.message,
+        'start': violation.start,
+        'end': violation.end,
+    }
+    if lines is not None and violation.start is not None:
+        record['line'], record['column'] = lines.position(violation.start)
+    return record
+
+
+class JsonLinesWriter(_BufferedWriter):
+    """Schreibt Ergebnisse als JSON Lines (pro Verstoß oder pro Dokument)"""
+
+    def __init__(self, stream: TextIO, per_document: bool = False, buffer_size: int = 256):
+        super().__init__(stream, buffer_size)
+        self.per_document = per_document
+
+    def write(self, document: str, result: ValidationResult, text: Optional[str] = None):
+        """
+        Schreibt das Ergebnis eines Dokuments
+
+        Args:
+            document: Name oder Pfad des Dokuments
+            result: Validierungsergebnis
+            text: Originaltext (optional, für Zeile/Spalte)
+        """
+        lines = LineIndex(text) if text is not None else None
+        violations = [_violation_record(document, v, lines) for v in result.violations]
+
+        if self.per_document:
+            for record in violations:
+                del record['document']
+            self._emit(json.dumps({
+                'document': document,
+                'valid': result.is_valid,
+                'score': result.score,
+                'violations': violations,
+            }, ensure_ascii=False) + '\n')
+        else:
+            for record in violations:
+                self._emit(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+class SarifWriter(_BufferedWriter):
+    """Schreibt Ergebnisse als SARIF 2.1.0 – Results werden fortlaufend angehängt"""
+
+    def __init__(self, stream: TextIO, tool_version: str = "3.1", buffer_size: int = 256):
+        super().__init__(stream, buffer_size)
+        self.tool_version = tool_version
+        self._started = False
+        self._first_result = True
+        self._closed = False
+
+    def _start(self):
+        """Schreibt Kopf mit Regel-Katalog und öffnet die Result-Liste"""
+        header = json.dumps({
+            'version': '2.1.0',
+            '$schema': SARIF_SCHEMA,
+            'runs': [{
+                'tool': {'driver': {
+                    'name': 'WWAQ-Validator',
+                    'version': self.tool_version,
+                    'rules': [
+                        {'id': rule, 'shortDescription': {'text': text}}
+                        for rule, text in RULES.items()
+                    ],
+                }},
+                'columnKind': 'unicodeCodePoints',
+                'results': [],
+            }],
+        }, ensure_ascii=False)
+        # Kopf bis einschließlich '"results": [' ausgeben, Rest folgt in close()
+        self._emit(header[:-len(']}]}')])
+        self._started = True
+
+    def write(self, document: str, result: ValidationResult, text: Optional[str] = None):
+        """Hängt die Verstöße eines Dokuments als SARIF-Results an"""
+        if not self._started:
+            self._start()
+
+        lines = LineIndex(text) if text is not None else None
+        uri = _artifact_uri(document)
+        for violation in result.violations:
+            location = {'artifactLocation': {'uri': uri}}
+            if violation.start is not None:
+                region = {
+                    'charOffset': violation.start,
+                    'charLength': violation.end - violation.start,
+                }
+                if lines is not None:
+                    region['startLine'], region['startColumn'] = lines.position(violation.start)
+                    region['endLine'], region['endColumn'] = lines.position(violation.end)
+                location['region'] = region
+
+            entry = json.dumps({
+                'ruleId': violation.rule,
+                'level': violation.level,
+                'message': {'text': violation.message},
+                'locations': [{'physicalLocation': location}],
+            }, ensure_ascii=False)
+            self._emit(entry if self._first_result else ',' + entry)
+            self._first_result = False
+
+    def close(self):
+        """Schließt Result-Liste und Dokument ab"""
+        if self._closed:
+            return
+        if not self._started:
+            self._start()
+        self._emit(']}]}\n')
+        self._closed = True
+        super().close()
+
+
+def stream_validate(documents: Iterable[Tuple[str, str]], writer,
+                    validator: Optional[WWAQValidator] = None) -> Dict[str, int]:
+    """
+    Validiert Dokumente nacheinander und schreibt jedes Ergebnis sofort
+
+    Args:
+        documents: (Name, Text)-Paare, gern als Generator
+        writer: JsonLinesWriter oder SarifWriter
+        validator: Zu verwendender Validator
+
+    Returns:
+        Zusammenfassung mit Anzahl Dokumente, Fehler, Warnungen, Vorschläge
+    """
+    validator = validator or WWAQValidator()
+    summary = {'documents': 0, 'errors': 0, 'warnings': 0, 'suggestions': 0}
+
+    for name, text in documents:
+        result = validator.validate(text)
+        writer.write(name, result, text)
+
+        summary['documents'] += 1
+        summary['errors'] += len(result.errors)
+        summary['warnings'] += len(result.warnings)
+        summary['suggestions'] += len(result.suggestions)
+
+    return summary
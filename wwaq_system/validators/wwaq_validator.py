@@ -9,9 +9,40 @@ Q! = Qawana! + DWEKUT!
 """
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+try:
+    from .context_rules import AnchorIndex, ContextException
+    from .fuzzy_index import SEFIROT, FuzzyTermIndex
+    from .hebrew_normalizer import HebrewNormalizer
+except ImportError:  # Direkter Aufruf als Skript
+    from context_rules import AnchorIndex, ContextException
+    from fuzzy_index import SEFIROT, FuzzyTermIndex
+    from hebrew_normalizer import HebrewNormalizer
+
+
+# Regel-Kennungen strukturierter Verstöße
+RULES = {
+    'zer-praefix': "Zer-Präfix statt WWAQ-konformer Form",
+    'q-vs-k': "K statt Q in Qabbala-Begriffen",
+    'anthropomorphismus': "Anthropomorphe Ausdrücke",
+    'emoji': "Emojis sind nicht WWAQ-konform",
+    'din-31636': "Schreibweise nicht nach DIN 31636",
+    'q-ende': "Text sollte mit 'Q!' enden",
+    'beinahe-treffer': "Ungenaue Transliteration eines WWAQ-Begriffs",
+}
+
+
+@dataclass
+class Violation:
+    """Einzelner Verstoß mit Regel, Stufe und Position im Originaltext"""
+    rule: str
+    level: str  # 'error', 'warning' oder 'note'
+    message: str
+    start: Optional[int] = None
+    end: Optional[int] = None
+
 
 @dataclass
 class ValidationResult:
@@ -19,14 +50,25 @@ class ValidationResult:
     is_valid: bool = True
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    suggestions: List[str] = field(default_factory=list)
     transformations: List[Tuple[str, str]] = field(default_factory=list)
+    # Positionen (start, end) der Transformationen im Originaltext
+    spans: List[Tuple[int, int]] = field(default_factory=list)
+    violations: List[Violation] = field(default_factory=list)
     score: float = 100.0
 
 
 class WWAQValidator:
     """Hauptklasse für WWAQ-Validierung"""
     
-    def __init__(self):
+    def __init__(self, normalizer: Optional[HebrewNormalizer] = None,
+                 suggestions: bool = True):
+        # Unicode-Vorverarbeitung (NFC, optional ohne Niqqud/Teamim)
+        self.normalizer = normalizer or HebrewNormalizer()
+        
+        # Beinahe-Treffer als Vorschläge melden
+        self.suggestions = suggestions
+        
         # Zer-Transformationen
         self.zer_transformations = {
             'zerbrechen': 'bersten',
@@ -57,6 +99,12 @@ class WWAQValidator:
             'kavana': 'Qawana'
         }
         
+        # Kontext-Ausnahmen je Regel-Kennung aus RULES (Anker innerhalb von N Zeichen)
+        self.context_exceptions = {
+            # Ausnahme: Wenn über Berg Centre gesprochen wird
+            'q-vs-k': ContextException(anchors=('Berg', 'Centre'), window=50)
+        }
+        
         # Verbotene anthropomorphe Phrasen
         self.forbidden_phrases = [
             'von herz zu herz',
@@ -84,6 +132,12 @@ class WWAQValidator:
             'atzilut': 'Azilut',
             'bnei baruch': 'Bnej Baruch'
         }
+        
+        # Fuzzy-Index für Beinahe-Treffer (Vorschläge)
+        self.fuzzy_index = FuzzyTermIndex()
+        self.fuzzy_index.add_mapping(self.din_corrections)
+        self.fuzzy_index.add_mapping(self.q_vs_k_terms)
+        self.fuzzy_index.add_terms(SEFIROT)
     
     def validate(self, text: str) -> ValidationResult:
         """
@@ -97,86 +151,208 @@ class WWAQValidator:
         """
         result = ValidationResult()
         
+        # Prüfe auf normalisiertem Text, Positionen beziehen sich aufs Original
+        normalized = self.normalizer.normalize(text)
+        text = normalized.text
+        
+        # Kontext-Anker einmal pro Dokument indizieren
+        anchor_index = AnchorIndex(text, self.context_exceptions.values())
+        
         # Prüfe Zer-Präfixe
-        self._check_zer_prefixes(text, result)
+        self._check_zer_prefixes(text, result, anchor_index)
         
         # Prüfe Q vs K
-        self._check_q_vs_k(text, result)
+        self._check_q_vs_k(text, result, anchor_index)
         
         # Prüfe Anthropomorphismen
-        self._check_anthropomorphisms(text, result)
+        self._check_anthropomorphisms(text, result, anchor_index)
         
         # Prüfe DIN-Konformität
-        self._check_din_conformity(text, result)
+        self._check_din_conformity(text, result, anchor_index)
         
         # Prüfe Q! am Ende
         self._check_q_ending(text, result)
         
+        # Suche Beinahe-Treffer (nur Vorschläge, ohne Einfluss auf Score)
+        if self.suggestions:
+            self._check_near_misses(text, result, anchor_index)
+        
         # Berechne Score
         total_issues = len(result.errors) + (len(result.warnings) * 0.5)
         result.score = max(0, 100 - (total_issues * 10))
         result.is_valid = len(result.errors) == 0
+        result.spans = [normalized.source_span(start, end) for start, end in result.spans]
+        for violation in result.violations:
+            if violation.start is not None:
+                violation.start, violation.end = normalized.source_span(
+                    violation.start, violation.end
+                )
         
         return result
     
-    def _check_zer_prefixes(self, text: str, result: ValidationResult):
+    def _report(self, result: ValidationResult, level: str, rule: str,
+                message: str, span: Optional[Tuple[int, int]] = None):
+        """Meldet einen Verstoß als Text und als strukturierten Eintrag"""
+        messages = {
+            'error': result.errors,
+            'warning': result.warnings,
+            'note': result.suggestions,
+        }
+        messages[level].append(message)
+        start, end = span if span else (None, None)
+        result.violations.append(Violation(rule, level, message, start, end))
+    
+    def _check_zer_prefixes(self, text: str, result: ValidationResult,
+                            anchor_index: Optional[AnchorIndex] = None):
         """Prüft auf Zer-Präfixe"""
+        anchor_index = anchor_index or self._anchor_index(text)
+        
         for zer_word, replacement in self.zer_transformations.items():
             pattern = rf'\b{zer_word}\b'
             matches = list(re.finditer(pattern, text, re.IGNORECASE))
             
             for match in matches:
-                result.errors.append(
-                    f"Zer-Präfix gefunden: '{match.group()}' → sollte '{replacement}' sein"
+                if self._is_excepted('zer-praefix', anchor_index, *match.span()):
+                    continue
+                self._report(
+                    result, 'error', 'zer-praefix',
+                    f"Zer-Präfix gefunden: '{match.group()}' → sollte '{replacement}' sein",
+                    match.span()
                 )
                 result.transformations.append((match.group(), replacement))
+                result.spans.append(match.span())
     
-    def _check_q_vs_k(self, text: str, result: ValidationResult):
+    def _anchor_index(self, text: str) -> AnchorIndex:
+        """Indiziert die Anker aller Kontext-Ausnahmen eines Textes"""
+        return AnchorIndex(text, self.context_exceptions.values())
+    
+    def _is_excepted(self, rule: str, anchor_index: AnchorIndex,
+                     start: int, end: int) -> bool:
+        """
+        Prüft ob ein Treffer einer Regel durch ihren Kontext ausgenommen ist
+        
+        Args:
+            rule: Regel-Kennung aus RULES (Schlüssel in context_exceptions)
+            anchor_index: Anker-Index des geprüften Textes
+            start: Startposition des Treffers
+            end: Endposition des Treffers
+        """
+        exception = self.context_exceptions.get(rule)
+        return exception is not None and exception.is_excepted(anchor_index, start, end)
+    
+    def _check_q_vs_k(self, text: str, result: ValidationResult,
+                      anchor_index: Optional[AnchorIndex] = None):
         """Prüft Q vs K Unterscheidung"""
+        anchor_index = anchor_index or self._anchor_index(text)
+        
         for k_term, q_term in self.q_vs_k_terms.items():
             pattern = rf'\b{k_term}\b'
             matches = list(re.finditer(pattern, text, re.IGNORECASE))
             
             for match in matches:
-                # Ausnahme: Wenn über Berg Centre gesprochen wird
-                context = text[max(0, match.start()-50):match.end()+50]
-                if 'Berg' not in context and 'Centre' not in context:
-                    result.errors.append(
-                        f"K statt Q: '{match.group()}' → sollte '{q_term}' sein"
-                    )
-                    result.transformations.append((match.group(), q_term))
+                if self._is_excepted('q-vs-k', anchor_index, *match.span()):
+                    continue
+                self._report(
+                    result, 'error', 'q-vs-k',
+                    f"K statt Q: '{match.group()}' → sollte '{q_term}' sein",
+                    match.span()
+                )
+                result.transformations.append((match.group(), q_term))
+                result.spans.append(match.span())
     
-    def _check_anthropomorphisms(self, text: str, result: ValidationResult):
+    def _check_anthropomorphisms(self, text: str, result: ValidationResult,
+                                 anchor_index: Optional[AnchorIndex] = None):
         """Prüft auf anthropomorphe Ausdrücke"""
+        anchor_index = anchor_index or self._anchor_index(text)
         text_lower = text.lower()
         
         for phrase in self.forbidden_phrases:
-            if phrase in text_lower:
-                result.errors.append(
-                    f"Anthropomorphismus gefunden: '{phrase}'"
-                )
+            if phrase not in text_lower:
+                continue
+            if len(text_lower) != len(text):
+                # lower() verschiebt Positionen: ohne Position melden
+                self._report(result, 'error', 'anthropomorphismus',
+                             f"Anthropomorphismus gefunden: '{phrase}'")
+                continue
+            # Erstes nicht ausgenommenes Vorkommen melden
+            pos = text_lower.find(phrase)
+            while pos != -1:
+                span = (pos, pos + len(phrase))
+                if not self._is_excepted('anthropomorphismus', anchor_index, *span):
+                    self._report(
+                        result, 'error', 'anthropomorphismus',
+                        f"Anthropomorphismus gefunden: '{phrase}'",
+                        span
+                    )
+                    break
+                pos = text_lower.find(phrase, pos + 1)
         
         # Prüfe auf Emojis
         emoji_pattern = re.compile(r'[😀-🙏]|❤️|💕|💖|✨|🌟|⭐')
-        if emoji_pattern.search(text):
-            result.errors.append("Emojis sind nicht WWAQ-konform")
+        for emoji in emoji_pattern.finditer(text):
+            if not self._is_excepted('emoji', anchor_index, *emoji.span()):
+                self._report(result, 'error', 'emoji', "Emojis sind nicht WWAQ-konform", emoji.span())
+                break
     
-    def _check_din_conformity(self, text: str, result: ValidationResult):
+    def _check_din_conformity(self, text: str, result: ValidationResult,
+                              anchor_index: Optional[AnchorIndex] = None):
         """Prüft DIN 31636 Konformität"""
+        anchor_index = anchor_index or self._anchor_index(text)
+        
         for wrong, correct in self.din_corrections.items():
             pattern = rf'\b{wrong}\b'
             matches = list(re.finditer(pattern, text, re.IGNORECASE))
             
             for match in matches:
-                result.warnings.append(
-                    f"DIN 31636: '{match.group()}' → sollte '{correct}' sein"
+                if self._is_excepted('din-31636', anchor_index, *match.span()):
+                    continue
+                self._report(
+                    result, 'warning', 'din-31636',
+                    f"DIN 31636: '{match.group()}' → sollte '{correct}' sein",
+                    match.span()
                 )
                 result.transformations.append((match.group(), correct))
+                result.spans.append(match.span())
     
     def _check_q_ending(self, text: str, result: ValidationResult):
         """Prüft auf Q! am Ende"""
         if not text.strip().endswith("Q!"):
-            result.warnings.append("Text sollte mit 'Q!' enden")
+            self._report(result, 'warning', 'q-ende', "Text sollte mit 'Q!' enden")
+    
+    def _check_near_misses(self, text: str, result: ValidationResult,
+                           anchor_index: Optional[AnchorIndex] = None):
+        """Prüft auf ungenaue Transliterationen (z.B. 'Kabalah', 'Tikoun')"""
+        anchor_index = anchor_index or self._anchor_index(text)
+        
+        # Positionen aus der Tokenisierung, Nachschlagen über den Index
+        tokens = list(re.finditer(r'\w+', text))
+        found = {match.token: match
+                 for match in self.fuzzy_index.scan(token.group() for token in tokens)}
+        
+        for token in tokens:
+            match = found.get(token.group())
+            if match is None or self._is_excepted('beinahe-treffer', anchor_index, *token.span()):
+                continue
+            self._report(
+                result, 'note', 'beinahe-treffer',
+                f"Beinahe-Treffer: '{match.token}' → meinte vermutlich '{match.canonical}'",
+                token.span()
+            )
+    
+    def _remove_normalized(self, pattern: str, text: str) -> str:
+        """Entfernt Treffer eines Musters, gesucht im normalisierten Text"""
+        normalized = self.normalizer.normalize(text)
+        if normalized.offsets is None:
+            return re.sub(pattern, '', text, flags=re.IGNORECASE)
+        
+        parts = []
+        last = 0
+        for match in re.finditer(pattern, normalized.text, re.IGNORECASE):
+            start, end = normalized.source_span(match.start(), match.end())
+            parts.append(text[last:start])
+            last = end
+        parts.append(text[last:])
+        return ''.join(parts)
     
     def transform(self, text: str) -> str:
         """
@@ -191,29 +367,31 @@ class WWAQValidator:
         # Validiere zuerst
         validation = self.validate(text)
         
-        # Wende alle Transformationen an
-        transformed = text
-        
-        # Sortiere Transformationen nach Position (rückwärts)
-        all_transforms = []
-        
-        # Sammle alle Transformationen mit Positionen
-        for original, replacement in validation.transformations:
-            for match in re.finditer(rf'\b{re.escape(original)}\b', transformed, re.IGNORECASE):
-                all_transforms.append((match.start(), match.end(), original, replacement))
-        
-        # Sortiere rückwärts und wende an
-        for start, end, original, replacement in sorted(all_transforms, reverse=True):
+        # Ersetze genau die gemeldeten Stellen im Originaltext
+        parts = []
+        last = 0
+        for (start, end), (original, replacement) in sorted(
+                zip(validation.spans, validation.transformations)):
+            if start < last:
+                continue  # Überlappende Treffer nur einmal ersetzen
+            
             # Behalte Großschreibung bei
-            if transformed[start].isupper():
+            if text[start].isupper():
                 replacement = replacement[0].upper() + replacement[1:]
             
-            transformed = transformed[:start] + replacement + transformed[end:]
+            parts.append(text[last:start])
+            parts.append(replacement)
+            last = end
+        parts.append(text[last:])
+        transformed = ''.join(parts)
         
-        # Entferne anthropomorphe Phrasen
+        # Entferne anthropomorphe Phrasen (nur solche, die vorkommen)
+        present = self.normalizer.normalize(transformed).text.lower()
         for phrase in self.forbidden_phrases:
+            if phrase not in present:
+                continue
             pattern = rf'[^.!?]*{re.escape(phrase)}[^.!?]*[.!?]\s*'
-            transformed = re.sub(pattern, '', transformed, flags=re.IGNORECASE)
+            transformed = self._remove_normalized(pattern, transformed)
         
         # Entferne Emojis
         emoji_pattern = re.compile(r'[😀-🙏]|❤️|💕|💖|✨|🌟|⭐')
@@ -237,6 +415,7 @@ def validate_text(text: str) -> Dict:
         'score': result.score,
         'errors': result.errors,
         'warnings': result.warnings,
+        'suggestions': result.suggestions,
         'transformations': [(o, r) for o, r in result.transformations]
     }
 